@@ -21,6 +21,7 @@ from typing import Any
 import numpy as np
 import torch
 import zarr
+from numcodecs.abc import Codec
 
 from earth2studio.utils.type import CoordSystem
 
@@ -35,12 +36,26 @@ class ZarrBackend:
         will create a directory store with this file name. If not, will create a memory store.
     chunks : dict[str, int], optional
         An ordered dict of chunks to use with the data passed through data/coords.
+    compressor : Codec | str | None, optional
+        Compressor used for data arrays, e.g.
+        `numcodecs.Blosc(cname="zstd", shuffle=numcodecs.Blosc.BITSHUFFLE)`. If None,
+        data is stored uncompressed, by default "default" (zarr default compressor)
+    synchronizer : zarr.ThreadSynchronizer | zarr.ProcessSynchronizer, optional
+        Synchronizer for the zarr group, required if multiple threads or processes
+        write to the same chunks concurrently, by default None
+    dtype : np.dtype | str, optional
+        Data type of data arrays in the store, e.g. "float16" to halve the size of
+        outputs. Written data is cast to this type. If None, the type of the initial
+        data is used or float32 if no data is provided, by default None
     """
 
     def __init__(
         self,
         file_name: str = None,
         chunks: dict[str, int] = {},
+        compressor: Codec | str | None = "default",
+        synchronizer: zarr.ThreadSynchronizer | zarr.ProcessSynchronizer | None = None,
+        dtype: np.dtype | str | None = None,
     ) -> None:
 
         if file_name is None:
@@ -48,11 +63,13 @@ class ZarrBackend:
         else:
             self.store = zarr.storage.DirectoryStore(file_name)
 
-        self.root = zarr.group(self.store)
+        self.root = zarr.group(self.store, synchronizer=synchronizer)
 
         # Read data from file, if available
         self.coords: CoordSystem = OrderedDict({})
         self.chunks = chunks.copy()
+        self.compressor = compressor
+        self.dtype = dtype
         for array in self.root:
             dims = self.root[array].attrs["_ARRAY_DIMENSIONS"]
             for dim in dims:
@@ -157,9 +174,16 @@ class ZarrBackend:
                 raise AssertionError(f"Warning! {name} is already in zarr store.")
 
             di = di.cpu().numpy() if di is not None else None
-            dtype = di.dtype if di is not None else "float32"
+            if self.dtype is not None:
+                dtype = self.dtype
+            else:
+                dtype = di.dtype if di is not None else "float32"
             self.root.create_dataset(
-                name, shape=shape, chunks=chunks, dtype=dtype, **kwargs
+                name,
+                shape=shape,
+                chunks=chunks,
+                dtype=dtype,
+                **({"compressor": self.compressor} | kwargs),
             )
             if di is not None:
                 self.root[name][:] = di
@@ -199,20 +223,16 @@ class ZarrBackend:
             if dim not in self.root:
                 raise AssertionError("Coordinate dimension not in zarr store.")
 
+        index = None
         for xi, name in zip(x, array_name):
             if name not in self.root:
                 self.add_array(coords, array_name, data=xi)
 
             else:
-                # Get indices as list of arrays and set torch tensor
-                self.root[name][
-                    np.ix_(
-                        *[
-                            np.where(np.in1d(self.coords[dim], value))[0]
-                            for dim, value in coords.items()
-                        ]
-                    )
-                ] = xi.to("cpu", non_blocking=False).numpy()
+                # Get indices once for all arrays and set torch tensor
+                if index is None:
+                    index = self._get_index(coords)
+                self.root[name].oindex[index] = xi.to("cpu", non_blocking=False).numpy()
 
     def read(
         self, coords: CoordSystem, array_name: str, device: torch.device = "cpu"
@@ -230,13 +250,29 @@ class ZarrBackend:
             device to place the read data from, by default 'cpu'
         """
 
-        x = self.root[array_name][
-            np.ix_(
-                *[
-                    np.where(np.in1d(self.coords[dim], value))[0]
-                    for dim, value in coords.items()
-                ]
-            )
-        ]
+        x = self.root[array_name].oindex[self._get_index(coords)]
 
         return torch.as_tensor(x, device=device), coords
+
+    def _get_index(self, coords: CoordSystem) -> tuple[slice | np.ndarray, ...]:
+        """Get orthogonal index of coordinates in the zarr group. Contiguous indices
+        are returned as slices so zarr can use basic selection on them.
+
+        Parameters
+        ----------
+        coords : CoordSystem
+            Coordinates to get the index of
+
+        Returns
+        -------
+        tuple[slice | np.ndarray, ...]
+            Index for each dimension of coords
+        """
+        index: list[slice | np.ndarray] = []
+        for dim, value in coords.items():
+            idx = np.where(np.in1d(self.coords[dim], value))[0]
+            if idx.shape[0] > 0 and idx[-1] - idx[0] == idx.shape[0] - 1:
+                index.append(slice(idx[0], idx[-1] + 1))
+            else:
+                index.append(idx)
+        return tuple(index)
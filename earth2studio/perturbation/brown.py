@@ -63,7 +63,7 @@ class Brown:
 
         noise = self._generate_noise_correlated(tuple(shape), device=x.device)
 
-        return x + self.noise_amplitude * noise, coords
+        return torch.add(x, noise, alpha=self.noise_amplitude), coords
 
     def _generate_noise_correlated(
         self, shape: tuple[int, ...], device: torch.device
@@ -51,4 +51,4 @@ class Gaussian:
         tuple[torch.Tensor, CoordSystem]:
             Output tensor and respective coordinate system dictionary
         """
-        return x + self.noise_amplitude * torch.randn_like(x), coords
+        return torch.add(x, torch.randn_like(x), alpha=self.noise_amplitude), coords
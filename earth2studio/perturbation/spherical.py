@@ -41,6 +41,11 @@ class SphericalGaussian:
         Length-scale parameter. Larger means more scales, by default 3.0
     sigma : Union[float, None], optional
         Scale parameter. If None, sigma = tau**(0.5*(2*alpha - 2.0)), by default None
+    cache : bool, optional
+        Keep the random field sampler between calls on the same grid and device. This
+        skips the costly setup of the inverse spherical harmonic transform for repeated
+        calls (e.g. batched ensembles) but keeps its weights in device memory, by
+        default False
     """
 
     def __init__(
@@ -49,11 +54,15 @@ class SphericalGaussian:
         alpha: float = 2.0,
         tau: float = 3.0,
         sigma: float | None = None,
+        cache: bool = False,
     ):
         self.noise_amplitude = noise_amplitude
         self.alpha = alpha
         self.tau = tau
         self.sigma = sigma
+        self.cache = cache
+        self._sampler: GaussianRandomFieldS2 | None = None
+        self._sampler_key: tuple | None = None
 
     @torch.inference_mode()
     def __call__(
@@ -85,28 +94,47 @@ class SphericalGaussian:
             raise ValueError("Lat/lon aspect ration must be N:2N or N+1:2N")
 
         nlat = 2 * (shape[-2] // 2)  # Noise only support even lat count
-        sampler = GaussianRandomFieldS2(
-            nlat=nlat,
-            alpha=self.alpha,
-            tau=self.tau,
-            sigma=self.sigma,
-            device=x.device,
-        )
-        sampler = sampler.to(x.device)
+        # Reuse cached sampler if possible, setting up the inverse SHT is expensive
+        sampler_key = (nlat, x.device, self.alpha, self.tau, self.sigma)
+        if (
+            self.cache
+            and self._sampler is not None
+            and self._sampler_key == sampler_key
+        ):
+            sampler = self._sampler
+        else:
+            sampler = GaussianRandomFieldS2(
+                nlat=nlat,
+                alpha=self.alpha,
+                tau=self.tau,
+                sigma=self.sigma,
+                device=x.device,
+            )
+        # Only hold on to the sampler if caching, otherwise release its weights
+        if self.cache:
+            self._sampler, self._sampler_key = sampler, sampler_key
+        else:
+            self._sampler, self._sampler_key = None, None
 
-        sample_noise = sampler(np.array(shape[:-2]).prod()).reshape(
+        noise = sampler(np.array(shape[:-2]).prod()).reshape(
             *shape[:-2], nlat, 2 * nlat
         )
 
-        # Hack for odd lat coords
+        # Hack for odd lat coords, last lat row reuses the noise of the row above
         if x.shape[-2] % 2 == 1:
-            noise = torch.zeros_like(x)
-            noise[..., :-1, :] = sample_noise
-            noise[..., -1:, :] = noise[..., -2:-1, :]
-        else:
-            noise = sample_noise
+            out = torch.empty_like(x)
+            torch.add(
+                x[..., :-1, :], noise, alpha=self.noise_amplitude, out=out[..., :-1, :]
+            )
+            torch.add(
+                x[..., -1:, :],
+                noise[..., -1:, :],
+                alpha=self.noise_amplitude,
+                out=out[..., -1:, :],
+            )
+            return out, coords
 
-        return x + self.noise_amplitude * noise, coords
+        return torch.add(x, noise, alpha=self.noise_amplitude), coords
 
 
 class GaussianRandomFieldS2(torch.nn.Module):
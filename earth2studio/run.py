@@ -15,7 +15,9 @@
 # limitations under the License.
 
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from math import ceil
 
 import numpy as np
@@ -35,6 +37,18 @@ logger.remove()
 logger.add(lambda msg: tqdm.write(msg, end=""), colorize=True)
 
 
+@torch.inference_mode()
+def _write(
+    io: IOBackend,
+    x: torch.Tensor | list[torch.Tensor],
+    coords: CoordSystem,
+    array_name: str | list[str],
+) -> None:
+    """Write to IO backend in inference mode. Inference mode is thread local, so it
+    needs to be entered again when writing from a background thread."""
+    io.write(x, coords, array_name)
+
+
 # sphinx - deterministic start
 def deterministic(
     time: list[str] | list[datetime] | list[np.datetime64],
@@ -103,12 +117,10 @@ def deterministic(
         if value.shape == (0,):
             del total_coords[key]
     total_coords["time"] = time
-    total_coords["lead_time"] = np.asarray(
-        [
-            prognostic.output_coords(prognostic.input_coords())["lead_time"] * i
-            for i in range(nsteps + 1)
-        ]
-    ).flatten()
+    total_coords["lead_time"] = (
+        np.arange(nsteps + 1)[:, None]
+        * prognostic.output_coords(prognostic.input_coords())["lead_time"][None, :]
+    ).ravel()
     total_coords.move_to_end("lead_time", last=False)
     total_coords.move_to_end("time", last=False)
 
@@ -124,13 +136,11 @@ def deterministic(
 
     logger.info("Inference starting!")
     with tqdm(total=nsteps + 1, desc="Running inference") as pbar:
-        for step, (x, coords) in enumerate(model):
+        for x, coords in islice(model, nsteps + 1):
             # Subselect domain/variables as indicated in output_coords
             x, coords = map_coords(x, coords, output_coords)
             io.write(*split_coords(x, coords))
             pbar.update(1)
-            if step == nsteps:
-                break
 
     logger.success("Inference complete")
     return io
@@ -209,12 +219,10 @@ def diagnostic(
         if value.shape == (0,):
             del total_coords[key]
     total_coords["time"] = time
-    total_coords["lead_time"] = np.asarray(
-        [
-            prognostic.output_coords(prognostic.input_coords())["lead_time"] * i
-            for i in range(nsteps + 1)
-        ]
-    ).flatten()
+    total_coords["lead_time"] = (
+        np.arange(nsteps + 1)[:, None]
+        * prognostic.output_coords(prognostic.input_coords())["lead_time"][None, :]
+    ).ravel()
     total_coords.move_to_end("lead_time", last=False)
     total_coords.move_to_end("time", last=False)
 
@@ -230,7 +238,7 @@ def diagnostic(
 
     logger.info("Inference starting!")
     with tqdm(total=nsteps + 1, desc="Running inference") as pbar:
-        for step, (x, coords) in enumerate(model):
+        for x, coords in islice(model, nsteps + 1):
 
             # Run diagnostic
             x, coords = map_coords(x, coords, diagnostic_ic)
@@ -239,8 +247,6 @@ def diagnostic(
             x, coords = map_coords(x, coords, output_coords)
             io.write(*split_coords(x, coords))
             pbar.update(1)
-            if step == nsteps:
-                break
 
     logger.success("Inference complete")
     return io
@@ -258,6 +264,7 @@ def ensemble(
     batch_size: int | None = None,
     output_coords: CoordSystem = OrderedDict({}),
     device: torch.device | None = None,
+    amp_dtype: torch.dtype | None = None,
 ) -> IOBackend:
     """Built in ensemble workflow.
 
@@ -284,11 +291,23 @@ def ensemble(
         IO output coordinate system override, by default OrderedDict({})
     device : torch.device, optional
         Device to run inference on, by default None
+    amp_dtype : torch.dtype, optional
+        Lower precision data type (e.g. torch.bfloat16) to run the prognostic model
+        with using torch.autocast. Outputs are cast back to the input data type before
+        being written. If None, autocasting is disabled, by default None
 
     Returns
     -------
     IOBackend
         Output IO object
+
+    Note
+    ----
+    To overlap IO with inference, `io.write` is called from a single background
+    thread under inference mode, one call at a time and in step order. The IO backend must therefore
+    support being written from a thread other than the one that created it. Errors
+    raised by `io.write` are re-raised in the calling thread and all writes are
+    completed before the workflow returns.
     """
     # sphinx - ensemble end
     logger.info("Running ensemble inference!")
@@ -316,18 +335,22 @@ def ensemble(
 
     # Set up IO backend with information from output_coords (if applicable).
     total_coords = {"ensemble": np.arange(nensemble)} | coords0.copy()
-    total_coords["lead_time"] = np.asarray(
-        [
-            prognostic.output_coords(prognostic.input_coords())["lead_time"] * i
-            for i in range(nsteps + 1)
-        ]
-    ).flatten()
+    total_coords["lead_time"] = (
+        np.arange(nsteps + 1)[:, None]
+        * prognostic.output_coords(prognostic.input_coords())["lead_time"][None, :]
+    ).ravel()
     for key, value in total_coords.items():
         total_coords[key] = output_coords.get(key, value)
 
     variables_to_save = total_coords.pop("variable")
     io.add_array(total_coords, variables_to_save)
 
+    # Map lat and lon if needed, done once since it is the same for all members
+    x0, coords0 = map_coords(x0, coords0, prognositc_ic)
+    # Pin initial condition so batch host to device copies are asynchronous
+    if torch.device(device).type == "cuda":
+        x0 = x0.pin_memory()
+
     # Compute batch sizes
     if batch_size is None:
         batch_size = nensemble
@@ -338,46 +361,72 @@ def ensemble(
         f"Starting {nensemble} Member Ensemble Inference with \
             {number_of_batches} number of batches."
     )
-    batch_id = 0
-    for batch_id in tqdm(
-        range(0, nensemble, batch_size),
-        total=number_of_batches,
-        desc="Total Ensemble Batches",
-    ):
-
-        # Get fresh batch data
-        x = x0.to(device)
-
-        # Expand x, coords for ensemble
-        mini_batch_size = min(batch_size, nensemble - batch_id)
-        coords = {
-            "ensemble": np.arange(batch_id, batch_id + mini_batch_size)
-        } | coords0.copy()
-
-        # Unsqueeze x for batching ensemble
-        x = x.unsqueeze(0).repeat(mini_batch_size, *([1] * x.ndim))
-
-        # Map lat and lon if needed
-        x, coords = map_coords(x, coords, prognositc_ic)
-
-        # Perturb ensemble
-        x, coords = perturbation(x, coords)
-
-        # Create prognostic iterator
-        model = prognostic.create_iterator(x, coords)
-
-        with tqdm(
-            total=nsteps + 1, desc=f"Running batch {batch_id} inference", leave=False
-        ) as pbar:
-            for step, (x, coords) in enumerate(model):
-                # Subselect domain/variables as indicated in output_coords
-                x, coords = map_coords(x, coords, output_coords)
-                io.write(*split_coords(x, coords))
-                pbar.update(1)
-                if step == nsteps:
-                    break
-
-        batch_id += 1
+    # Inference mode only covers compute so IO state created above (e.g. in
+    # io.add_array) stays regular tensors. A single background writer lets IO of
+    # step n overlap with compute of step n + 1
+    with torch.inference_mode(), ThreadPoolExecutor(max_workers=1) as executor:
+        write_future: Future | None = None
+        # Host buffers reused for outputs, alternated so one is filled while the
+        # previous write's buffer is still being read. Indexed by a write counter
+        # that runs across batches so consecutive writes never share a buffer
+        staging: list[torch.Tensor] = []
+        nwrites = 0
+        for batch_id in tqdm(
+            range(0, nensemble, batch_size),
+            total=number_of_batches,
+            desc="Total Ensemble Batches",
+        ):
+
+            # Get fresh batch data
+            x = x0.to(device, non_blocking=True)
+
+            # Expand x, coords for ensemble
+            mini_batch_size = min(batch_size, nensemble - batch_id)
+            coords = {
+                "ensemble": np.arange(batch_id, batch_id + mini_batch_size)
+            } | coords0.copy()
+
+            # Unsqueeze x for batching ensemble, materialized since perturbations may
+            # modify the input tensor in place
+            x = x.unsqueeze(0).repeat(mini_batch_size, *([1] * x.ndim))
+
+            # Perturb ensemble
+            x, coords = perturbation(x, coords)
+
+            # Create prognostic iterator
+            model = prognostic.create_iterator(x, coords)
+
+            with torch.autocast(
+                device_type=torch.device(device).type,
+                dtype=amp_dtype,
+                enabled=amp_dtype is not None,
+            ), tqdm(
+                total=nsteps + 1,
+                desc=f"Running batch {batch_id} inference",
+                leave=False,
+            ) as pbar:
+                for x, coords in islice(model, nsteps + 1):
+                    # Subselect domain/variables as indicated in output_coords
+                    x, coords = map_coords(x, coords, output_coords)
+                    if not staging or staging[0].shape != x.shape:
+                        staging = [
+                            torch.empty(
+                                x.shape,
+                                dtype=x0.dtype,
+                                pin_memory=torch.device(device).type == "cuda",
+                            )
+                            for _ in range(2)
+                        ]
+                    x = staging[nwrites % 2].copy_(x)
+                    # Wait on previous write, also raises any error from the writer
+                    if write_future is not None:
+                        write_future.result()
+                    write_future = executor.submit(_write, io, *split_coords(x, coords))
+                    nwrites += 1
+                    pbar.update(1)
+
+        if write_future is not None:
+            write_future.result()
 
     logger.success("Inference complete")
     return io
@@ -189,7 +189,9 @@ def map_coords(
     Returns
     -------
     tuple[torch.Tensor, CoordSystem]
-        Mapped data and coordinate system.
+        Mapped data and coordinate system. If the coordinates already match the
+        output coordinates, the input tensor may be returned unchanged (not a copy),
+        so the result should not be modified in place assuming it is a copy.
 
     Raises
     ------
@@ -215,6 +217,11 @@ def map_coords(
         inc = mapped_coords[key]
         dim = list(input_coords).index(key)
 
+        # Coordinates already match, no need to index
+        if inc.shape == outc.shape and np.all(inc == outc):
+            mapped_coords[key] = outc
+            continue
+
         if not np.issubdtype(value.dtype, np.number):
             if not np.all(np.isin(outc, inc)):
                 raise ValueError(f"Error! Some elements of {outc} are not in {inc}.")
@@ -244,11 +251,7 @@ def map_coords(
         else:
 
             # Method = nearest
-            c1 = np.repeat(inc[:, np.newaxis], outc.shape[0], axis=1)
-            c2 = np.repeat(outc[np.newaxis, :], inc.shape[0], axis=0)
-            c = np.abs(c1 - c2)
-
-            idx = np.argmin(c, axis=0)
+            idx = np.argmin(np.abs(inc[:, np.newaxis] - outc[np.newaxis, :]), axis=0)
 
             x = torch.index_select(
                 x, dim, torch.tensor(idx, dtype=torch.int32, device=x.device)
@@ -52,7 +52,8 @@ In this example you will learn:
 #
 # - Prognostic Model: Use the built in FourCastNet model :py:class:`earth2studio.models.px.FCN`.
 # - perturbation_method: Use the Spherical Gaussian Method :py:class:`earth2studio.perturbation.SphericalGaussian`.
-# - Datasource: Pull data from the GFS data api :py:class:`earth2studio.data.GFS`.
+# - Datasource: Pull data from the GFS data api :py:class:`earth2studio.data.GFS`, saved
+#   to a local file read with :py:class:`earth2studio.data.DataArrayFile`.
 # - IO Backend: Save the outputs into a Zarr store :py:class:`earth2studio.io.ZarrBackend`.
 
 # %%
@@ -63,9 +64,10 @@ from dotenv import load_dotenv
 
 load_dotenv()  # TODO: make common example prep function
 
+import numcodecs
 import numpy as np
 
-from earth2studio.data import GFS
+from earth2studio.data import GFS, DataArrayFile, datasource_to_file
 from earth2studio.io import ZarrBackend
 from earth2studio.models.px import FCN
 from earth2studio.perturbation import SphericalGaussian
@@ -78,12 +80,24 @@ model = FCN.load_model(package)
 # Instantiate the pertubation method
 sg = SphericalGaussian(noise_amplitude=0.15)
 
-# Create the data source
-data = GFS()
+# Create the data source, the initial condition is fetched from GFS once and saved to
+# a local file so repeated runs (e.g. with other perturbations) skip the download
+ic_file = "outputs/03_ensemble_ic.nc"
+if not os.path.isfile(ic_file):
+    datasource_to_file(ic_file, GFS(), ["2024-01-01"], model.input_coords()["variable"])
+data = DataArrayFile(ic_file)
 
 # Create the IO handler, store in memory
-chunks = {"ensemble": 1, "time": 1}
-io = ZarrBackend(file_name="outputs/02_ensemble_sg.zarr", chunks=chunks)
+# Chunk along the dimensions written each step so every write fills whole chunks
+# Outputs are stored compressed in half precision, which is plenty for plotting
+chunks = {"ensemble": 1, "time": 1, "lead_time": 1}
+compressor = numcodecs.Blosc(cname="zstd", clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE)
+io = ZarrBackend(
+    file_name="outputs/02_ensemble_sg.zarr",
+    chunks=chunks,
+    compressor=compressor,
+    dtype="float16",
+)
 
 # %%
 # Execute the Workflow
@@ -100,7 +114,7 @@ io = ZarrBackend(file_name="outputs/02_ensemble_sg.zarr", chunks=chunks)
 
 nsteps = 10
 nensemble = 8
-batch_size = 2
+batch_size = 4
 io = ensemble(
     ["2024-01-01"],
     nsteps,
@@ -127,15 +141,24 @@ import matplotlib.pyplot as plt
 
 forecast = "2024-01-01"
 
+# Create a Robinson projection
+projection = ccrs.Robinson()
+# Project the lat/lon grid once for all panels, longitudes are shifted to [-180, 180)
+# so the grid does not wrap around the projection
+lon = (io["lon"][:] + 180) % 360 - 180
+lon_order = np.argsort(lon)
+lon2d, lat2d = np.meshgrid(lon[lon_order], io["lat"][:])
+xy = projection.transform_points(ccrs.PlateCarree(), lon2d, lat2d)
+
 
 def plot_(axi, data, title, cmap):
     """Convenience function for plotting pcolormesh."""
     # Plot the field using pcolormesh
     im = axi.pcolormesh(
-        io["lon"][:],
-        io["lat"][:],
-        data,
-        transform=ccrs.PlateCarree(),
+        xy[..., 0],
+        xy[..., 1],
+        data[..., lon_order],
+        transform=projection,
         cmap=cmap,
     )
     plt.colorbar(im, ax=axi, shrink=0.6, pad=0.04)
@@ -150,14 +173,23 @@ for variable, cmap in zip(["tcwv"], ["Blues"]):
     step = 4  # lead time = 24 hrs
 
     plt.close("all")
-    # Create a Robinson projection
-    projection = ccrs.Robinson()
 
     # Create a figure and axes with the specified projection
     fig, (ax1, ax2, ax3) = plt.subplots(
         nrows=1, ncols=3, subplot_kw={"projection": projection}, figsize=(16, 3)
     )
 
+    # Compute the ensemble standard deviation one member at a time (Welford's
+    # algorithm) so only a single field is read from the Zarr store at once
+    mean = np.zeros(io[variable].shape[-2:])
+    m2 = np.zeros(io[variable].shape[-2:])
+    for i in range(nensemble):
+        member = io[variable][i, 0, step]
+        delta = member - mean
+        mean += delta / (i + 1)
+        m2 += delta * (member - mean)
+    std = np.sqrt(m2 / nensemble)
+
     plot_(
         ax1,
         io[variable][0, 0, step],
@@ -172,7 +204,7 @@ for variable, cmap in zip(["tcwv"], ["Blues"]):
     )
     plot_(
         ax3,
-        np.std(io[variable][:, 0, step], axis=0),
+        std,
         f"{forecast} - Lead time: {6*step}hrs - Std",
         cmap,
     )
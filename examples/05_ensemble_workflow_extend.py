@@ -112,7 +112,7 @@ class ApplyToVariable:
 avsg = ApplyToVariable(SphericalGaussian(noise_amplitude=1.0), "t2m")
 
 # Create the IO handler, store in memory
-chunks = {"ensemble": 1, "time": 1}
+chunks = {"ensemble": 1, "time": 1, "lead_time": 1}
 io = ZarrBackend(file_name="outputs/05_ensemble_avsg.zarr", chunks=chunks)
 
 # %%
@@ -100,7 +100,7 @@ model = DLWP.load_model(package)
 data = GFS()
 
 # Create the IO handler, store in memory
-chunks = {"ensemble": 1, "time": 1}
+chunks = {"ensemble": 1, "time": 1, "lead_time": 1}
 io_unperturbed = ZarrBackend(file_name="outputs/05_ensemble.zarr", chunks=chunks)
 
 
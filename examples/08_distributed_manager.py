@@ -33,6 +33,7 @@ In this example you will learn:
 
 - How to use the distributed manager to access parallel environment properties
 - Parallelize deterministic inference across multiple initial date-times
+- Parallelize ensemble inference by sharding ensemble members
 - Limitations of parallel inference in Earth2Studio
 - Post-processing strategies of parallel job outputs
 """
@@ -192,3 +193,54 @@ if dist.rank == 0:
         f'TCWV Forecast Lead Time - {ds.coords["lead_time"].values[-1].astype("timedelta64[D]").astype(int)} days'
     )
     plt.savefig("outputs/08_tcwv_distributed_manager.jpg")
+
+# %%
+# Distributed Ensembles
+# ---------------------
+# Ensemble members are independent of each other, so large ensembles can be sharded
+# across processes in the same way. Each process runs the ensemble workflow for its
+# share of the members on its own device and writes to its own Zarr store.
+#
+# The default random generator of each process starts from the same fixed seed, so
+# without intervention every shard would draw identical perturbations. Each process is
+# therefore seeded explicitly with an offset of its rank.
+
+# %%
+from earth2studio.perturbation import SphericalGaussian
+
+nensemble = 8
+assert (  # noqa: S101
+    nensemble >= dist.world_size
+), "Ensemble members should be at least the number of processes"
+members = np.array_split(np.arange(nensemble), dist.world_size)[dist.rank]
+
+seed = 42
+torch.manual_seed(seed + dist.rank)
+
+chunks = {"ensemble": 1, "time": 1, "lead_time": 1}
+io = ZarrBackend(file_name=f"outputs/08_ensemble_{dist.rank}.zarr", chunks=chunks)
+io = run.ensemble(
+    times[:1],
+    8,
+    len(members),
+    model,
+    data,
+    io,
+    SphericalGaussian(noise_amplitude=0.15),
+    output_coords=output_coords,
+    device=dist.device,
+)
+torch.distributed.barrier()
+
+# %%
+# Member indices in each store are local to the process, so they are relabeled with
+# their global index when the stores are combined along the ensemble dimension.
+
+# %%
+if dist.rank == 0:
+    paths = [f"outputs/08_ensemble_{i}.zarr" for i in range(dist.world_size)]
+    ds = xr.open_mfdataset(
+        paths, combine="nested", concat_dim="ensemble", engine="zarr"
+    )
+    ds = ds.assign_coords(ensemble=np.arange(nensemble))
+    print(ds)
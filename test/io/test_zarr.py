@@ -17,7 +17,9 @@
 import os
 import tempfile
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import numcodecs
 import numpy as np
 import pytest
 import torch
@@ -277,6 +279,124 @@ def test_zarr_variable(
         assert np.allclose(z[variable[0]][0, :, :180], partial_data.to("cpu").numpy())
 
 
+@pytest.mark.parametrize(
+    "compressor",
+    [
+        "default",
+        None,
+        numcodecs.Blosc(cname="zstd", clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE),
+    ],
+)
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_zarr_compressor(compressor, device: str) -> None:
+
+    total_coords = OrderedDict(
+        {
+            "time": np.asarray([np.datetime64("1958-01-31")]),
+            "lat": np.linspace(-90, 90, 180),
+            "lon": np.linspace(0, 360, 360, endpoint=False),
+        }
+    )
+
+    z = ZarrBackend(chunks={"time": 1}, compressor=compressor)
+    x = torch.randn(1, 180, 360, device=device)
+    z.add_array(total_coords, "fields")
+    z.write(x, total_coords, "fields")
+
+    if compressor == "default":
+        assert z["fields"].compressor == zarr.storage.default_compressor
+    else:
+        assert z["fields"].compressor == compressor
+    assert np.allclose(z["fields"][:], x.cpu().numpy())
+
+    # Array kwargs take priority over the backend compressor
+    z.add_array(total_coords, "fields_raw", compressor=None)
+    assert z["fields_raw"].compressor is None
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_zarr_write_index(device: str) -> None:
+
+    total_coords = OrderedDict(
+        {
+            "lead_time": np.arange(4),
+            "lat": np.linspace(-90, 90, 18),
+            "lon": np.linspace(0, 360, 36, endpoint=False),
+        }
+    )
+
+    z = ZarrBackend()
+    z.add_array(total_coords, "fields")
+
+    # Contiguous coordinates are written with slices, others with index arrays
+    x = torch.randn(2, 18, 3, device=device)
+    coords = total_coords | {
+        "lead_time": np.array([1, 2]),
+        "lon": total_coords["lon"][[0, 5, 6]],
+    }
+    z.write(x, coords, "fields")
+    assert np.allclose(z["fields"][1:3][:, :, [0, 5, 6]], x.cpu().numpy())
+
+    y, _ = z.read(coords, "fields", device=device)
+    assert torch.allclose(y, x)
+
+
+@pytest.mark.parametrize("dtype", [None, "float16", np.float64])
+def test_zarr_dtype(dtype) -> None:
+
+    total_coords = OrderedDict(
+        {
+            "lat": np.linspace(-90, 90, 18),
+            "lon": np.linspace(0, 360, 36, endpoint=False),
+        }
+    )
+
+    z = ZarrBackend(dtype=dtype)
+    x = torch.randn(18, 36)
+    z.add_array(total_coords, "fields")
+    z.add_array(total_coords, "fields_init", data=x.double())
+    z.write(x, total_coords, "fields")
+
+    if dtype is None:
+        assert z["fields"].dtype == np.float32
+        assert z["fields_init"].dtype == np.float64
+    else:
+        assert z["fields"].dtype == np.dtype(dtype)
+        assert z["fields_init"].dtype == np.dtype(dtype)
+    assert np.allclose(z["fields"][:], x.numpy(), atol=1e-2)
+
+
+def test_zarr_synchronizer() -> None:
+
+    total_coords = OrderedDict(
+        {
+            "lead_time": np.arange(8),
+            "lat": np.linspace(-90, 90, 18),
+            "lon": np.linspace(0, 360, 36, endpoint=False),
+        }
+    )
+
+    assert ZarrBackend().root.synchronizer is None
+
+    synchronizer = zarr.ThreadSynchronizer()
+    z = ZarrBackend(synchronizer=synchronizer)
+    z.add_array(total_coords, "fields")
+    assert z.root.synchronizer is synchronizer
+    assert z["fields"].synchronizer is synchronizer
+
+    # Lead times share a single chunk, write them from multiple threads
+    x = torch.randn(8, 18, 36)
+
+    def write(i: int) -> None:
+        coords = total_coords | {"lead_time": total_coords["lead_time"][i : i + 1]}
+        z.write(x[i : i + 1], coords, "fields")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(8)))
+
+    assert np.allclose(z["fields"][:], x.numpy())
+
+
 @pytest.mark.parametrize(
     "time",
     [
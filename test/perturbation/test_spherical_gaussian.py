@@ -63,6 +63,70 @@ def test_spherical_gaussian(x, coords, amplitude, alpha, tau, sigma, device):
     assert dx.device == x.device
 
 
+@pytest.mark.parametrize(
+    "device",
+    [
+        "cpu",
+        pytest.param(
+            "cuda:0",
+            marks=pytest.mark.skipif(
+                not torch.cuda.is_available(), reason="cuda missing"
+            ),
+        ),
+    ],
+)
+def test_spherical_gaussian_odd_lat(device):
+
+    x = torch.randn(2, 3, 17, 32).to(device)
+    coords = OrderedDict([("a", []), ("b", []), ("lat", []), ("lon", [])])
+
+    prtb = SphericalGaussian(noise_amplitude=0.5)
+    xout, coords = prtb(x, coords)
+    dx = xout - x
+
+    assert dx.shape == x.shape
+    assert torch.allclose(dx[..., -1, :], dx[..., -2, :], atol=1e-5)
+    assert prtb._sampler is None
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        "cpu",
+        pytest.param(
+            "cuda:0",
+            marks=pytest.mark.skipif(
+                not torch.cuda.is_available(), reason="cuda missing"
+            ),
+        ),
+    ],
+)
+def test_spherical_gaussian_cache(device):
+
+    x = torch.randn(2, 3, 16, 32).to(device)
+    coords = OrderedDict([("a", []), ("b", []), ("lat", []), ("lon", [])])
+
+    prtb = SphericalGaussian(cache=True)
+    prtb(x, coords)
+    sampler = prtb._sampler
+    assert sampler is not None
+    # Sampler is reused for inputs with the same grid and parameters
+    prtb(x, coords)
+    assert prtb._sampler is sampler
+    prtb.tau = 5.0
+    prtb(x, coords)
+    assert prtb._sampler is not sampler
+
+    # Sampler is not reused and is released when caching is disabled
+    def stale_sampler(*args):
+        raise AssertionError("Cached sampler used with caching disabled")
+
+    prtb._sampler = stale_sampler
+    prtb.cache = False
+    prtb(x, coords)
+    assert prtb._sampler is None
+
+
 @pytest.mark.parametrize(
     "x, coords, error",
     [
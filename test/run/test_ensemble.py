@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from collections import OrderedDict
+from time import sleep
 
 import numpy as np
 import pytest
@@ -22,7 +23,7 @@ import torch
 
 import earth2studio.run as run
 from earth2studio.data import Random
-from earth2studio.io import ZarrBackend
+from earth2studio.io import KVBackend, ZarrBackend
 from earth2studio.models.px import Persistence
 from earth2studio.perturbation import Gaussian, Zero
 from earth2studio.utils.type import CoordSystem
@@ -43,6 +44,31 @@ class TestPersistence(Persistence):
         return super()._forward(x, coords)
 
 
+class SlowWriteMixin:
+    """IO backend mixin with slow writes to exercise the background writer"""
+
+    def __init__(self, *args, delay: float = 0.05, fail_on: int | None = None):
+        super().__init__(*args)
+        self.delay = delay
+        self.fail_on = fail_on
+        self.nwrites = 0
+
+    def write(self, *args, **kwargs) -> None:
+        self.nwrites += 1
+        if self.nwrites == self.fail_on:
+            raise RuntimeError("Write failed")
+        sleep(self.delay)
+        super().write(*args, **kwargs)
+
+
+class SlowZarrBackend(SlowWriteMixin, ZarrBackend):
+    pass
+
+
+class SlowKVBackend(SlowWriteMixin, KVBackend):
+    pass
+
+
 @pytest.mark.parametrize(
     "coords",
     [
@@ -143,3 +169,263 @@ def test_ensemble_output_coords(output_coords, device):
     del output_coords["variable"]
     for key, value in output_coords.items():
         assert np.array_equal(io[key], value)
+
+
+# Persistence with an autocast eligible identity matmul, records the compute dtype
+class MatmulPersistence(TestPersistence):
+    def __init__(self, *args, target_device="cpu"):
+        super().__init__(*args, target_device=target_device)
+        self.dtypes: list[torch.dtype] = []
+
+    def _forward(
+        self,
+        x: torch.Tensor,
+        coords: CoordSystem,
+    ) -> tuple[torch.Tensor, CoordSystem]:
+        x = x @ torch.eye(x.shape[-1], device=x.device)
+        self.dtypes.append(x.dtype)
+        return super()._forward(x, coords)
+
+
+# Zarr backend that records the data type of tensors passed to write
+class DtypeZarrBackend(ZarrBackend):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.dtypes: list[torch.dtype] = []
+
+    def write(self, x, *args, **kwargs) -> None:
+        self.dtypes.extend([xi.dtype for xi in x] if isinstance(x, list) else [x.dtype])
+        super().write(x, *args, **kwargs)
+
+
+@pytest.mark.parametrize("amp_dtype", [None, torch.bfloat16])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_ensemble_amp_dtype(amp_dtype, device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+    nsteps = 2
+    nensemble = 2
+    time = ["2024-01-01"]
+
+    data = Random(domain_coords=coords)
+    model = MatmulPersistence(variable, coords, target_device=device)
+    io = DtypeZarrBackend()
+
+    io = run.ensemble(
+        time,
+        nsteps,
+        nensemble,
+        model,
+        data,
+        io,
+        Gaussian(),
+        device=device,
+        amp_dtype=amp_dtype,
+    )
+
+    # Model should run in the autocast data type if set
+    assert len(model.dtypes) == nsteps
+    assert all(dtype == (amp_dtype or torch.float32) for dtype in model.dtypes)
+    # Outputs should be cast back before being written
+    assert len(io.dtypes) > 0
+    assert all(dtype == torch.float32 for dtype in io.dtypes)
+    for var in variable:
+        assert io[var].dtype == np.float32
+        assert io[var].shape == (nensemble, len(time), nsteps + 1, 10, 20)
+        assert not np.any(np.isnan(io[var][:]))
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_ensemble_members_independent(device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+    nensemble = 4
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = ZarrBackend()
+
+    io = run.ensemble(
+        ["2024-01-01"],
+        1,
+        nensemble,
+        model,
+        data,
+        io,
+        Gaussian(),
+        batch_size=2,
+        device=device,
+    )
+
+    # Each member should get its own perturbation of the initial condition
+    for var in variable:
+        x = io[var][:, 0, 0]
+        for i in range(1, nensemble):
+            assert not np.allclose(x[0], x[i])
+
+
+class InplacePerturbation:
+    """Perturbation that modifies its input in place"""
+
+    def __call__(
+        self, x: torch.Tensor, coords: CoordSystem
+    ) -> tuple[torch.Tensor, CoordSystem]:
+        ind = np.in1d(coords["variable"], ["u10m"])
+        x[..., ind, :, :] = x[..., ind, :, :] + 1
+        x[..., ~ind, :, :] = torch.randn_like(x[..., ~ind, :, :])
+        return x, coords
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_ensemble_inplace_perturbation(batch_size, device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = ZarrBackend()
+
+    io = run.ensemble(
+        ["2024-01-01"],
+        1,
+        4,
+        model,
+        data,
+        io,
+        InplacePerturbation(),
+        batch_size=batch_size,
+        device=device,
+    )
+
+    # Initial condition should not be modified between batches
+    u10m = io["u10m"][:, :, 0]
+    for i in range(1, 4):
+        assert np.allclose(u10m[i], u10m[0])
+    # Members should not share storage within a batch
+    v10m = io["v10m"][:, :, 0]
+    for i in range(1, 4):
+        assert not np.allclose(v10m[i], v10m[0])
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+@pytest.mark.parametrize("io_backend", [SlowZarrBackend, SlowKVBackend])
+def test_ensemble_async_write(io_backend, device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+    nsteps = 3
+    nensemble = 2
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = io_backend()
+
+    io = run.ensemble(
+        ["2024-01-01"],
+        nsteps,
+        nensemble,
+        model,
+        data,
+        io,
+        Zero(),
+        device=device,
+    )
+
+    # All writes should be flushed once the workflow returns
+    assert io.nwrites == nsteps + 1
+    for var in variable:
+        x = np.asarray(io[var][:])
+        assert not np.any(np.isnan(x))
+        for step in range(1, nsteps + 1):
+            assert np.allclose(x[:, :, step], x[:, :, 0])
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+@pytest.mark.parametrize("io_backend", [SlowZarrBackend, SlowKVBackend])
+def test_ensemble_async_write_error(io_backend, device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+
+    # Errors in the background writer should be raised in the workflow, including
+    # the final write
+    for fail_on in [2, 4]:
+        io = io_backend(fail_on=fail_on)
+        with pytest.raises(RuntimeError, match="Write failed"):
+            run.ensemble(
+                ["2024-01-01"],
+                3,
+                2,
+                model,
+                data,
+                io,
+                Zero(),
+                device=device,
+            )
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+@pytest.mark.parametrize("nsteps", [2, 3])
+@pytest.mark.parametrize("io_backend", [SlowZarrBackend, SlowKVBackend])
+def test_ensemble_async_write_batches(io_backend, device, nsteps):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = io_backend()
+
+    # Multiple batches with slow writes, staging buffers must not be overwritten
+    # while a previous write is still in flight
+    io = run.ensemble(
+        ["2024-01-01"],
+        nsteps,
+        4,
+        model,
+        data,
+        io,
+        Gaussian(),
+        batch_size=2,
+        device=device,
+    )
+
+    for var in variable:
+        x = np.asarray(io[var][:])
+        for step in range(1, nsteps + 1):
+            assert np.allclose(x[:, :, step], x[:, :, 0])
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_ensemble_io_outside_inference_mode(device):
+
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = KVBackend()
+
+    io = run.ensemble(
+        ["2024-01-01"],
+        2,
+        2,
+        model,
+        data,
+        io,
+        Gaussian(),
+        device=device,
+    )
+
+    # IO state is owned by the user and should remain writable outside the workflow
+    assert not io["u10m"].is_inference()
+    x = torch.zeros(io["u10m"].shape)
+    io.write(x, io.coords, "u10m")
+    assert torch.all(io["u10m"] == 0)
@@ -115,6 +115,29 @@ def test_map_nearest(device):
     assert torch.allclose(out, data[:, :2])
 
 
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_map_identity(device):
+    coords = OrderedDict(
+        [("variable", np.array(["a", "b", "c"])), ("lat", np.array([1.0, 2.0, 3.0]))]
+    )
+    data = torch.randn(3, 3).to(device)
+
+    # Matching coordinates should not copy the tensor
+    out, outc = map_coords(data, coords, coords)
+    assert out is data
+    assert np.all(outc["variable"] == coords["variable"])
+    assert np.all(outc["lat"] == coords["lat"])
+
+    out, outc = map_coords(
+        data,
+        coords,
+        OrderedDict(
+            [("variable", np.array(["a", "b", "c"])), ("lat", np.array([2.0]))]
+        ),
+    )
+    assert torch.allclose(out, data[:, 1:2])
+
+
 def test_map_errors():
     coords = OrderedDict(
         [("variable", np.array(["a", "b", "c"])), ("lat", np.array([1, 2, 3]))]